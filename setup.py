@@ -5,6 +5,7 @@ setup(
     version='0.0.3',
     description='VirtualBox VM Management Tool',
     packages=['vbox'],
+    python_requires='>=3.8',
     entry_points={
         'console_scripts': [
             'vm = vbox.__main__:main'
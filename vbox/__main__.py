@@ -1,19 +1,20 @@
 """Manages VirtualBox VMs"""
 # PYTHON_ARGCOMPLETE_OK
 
-from __future__ import print_function
-
 import argparse
-import textwrap
+import os
+import sys
 
 import vbox.config
 import vbox.error
 import vbox.json_file
-import vbox.manager
 
 
 def main():
-    args = _parse_args()
+    args = _sniff_fast_path_args(sys.argv[1:])
+    if args is None:
+        args = _parse_args()
+
     try:
         args.run(args)
     except vbox.json_file.JsonFileNotFoundError as err:
@@ -23,19 +24,30 @@ def main():
         print(str(err))
 
 
+def _sniff_fast_path_args(argv):
+    """
+    Returns the parsed arguments for "vm current [name|address]" without
+    building the full parser, or None if *argv* is anything else
+    """
+    if argv == ['current']:
+        details = 'name'
+    elif argv in (['current', 'name'], ['current', 'address']):
+        details = argv[1]
+    else:
+        return None
+
+    return argparse.Namespace(details=details, run=_display_current)
+
+
 def _parse_args():
     parser = argparse.ArgumentParser(description=__doc__)
 
     subparsers = parser.add_subparsers()
-    _add_connect_subparser(subparsers)
-    _add_start_subparser(subparsers)
-    _add_stop_subparser(subparsers)
-    _add_reboot_subparser(subparsers)
-    _add_add_subparser(subparsers)
-    _add_remove_subparser(subparsers)
-    _add_select_subparser(subparsers)
-    _add_list_subparser(subparsers)
-    _add_current_subparser(subparsers)
+    for name, help_text, arguments, run in _SUBCOMMANDS:
+        subparser = subparsers.add_parser(name, help=help_text)
+        for flags, options in arguments:
+            subparser.add_argument(*flags, **options)
+        subparser.set_defaults(run=run)
 
     _try_enabling_autocomplete(parser)
 
@@ -43,6 +55,11 @@ def _parse_args():
 
 
 def _try_enabling_autocomplete(parser):
+    # argcomplete sets _ARGCOMPLETE when the shell asks for completions;
+    # otherwise it would do nothing, so don't bother importing it
+    if not os.environ.get('_ARGCOMPLETE'):
+        return
+
     try:
         import argcomplete
     except ImportError:
@@ -51,100 +68,60 @@ def _try_enabling_autocomplete(parser):
         argcomplete.autocomplete(parser)
 
 
-def _add_connect_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'connect',
-        help='Connects to a VM via SSH (starts first if not running)'
-    )
-    parser.add_argument(
-        'name',
-        nargs='?',
-        help='name of VM'
-    )
-    parser.add_argument(
-        '-a', '--address',
-        help='address of VM'
-    )
-    parser.add_argument(
-        '-u', '--user',
-        help='user with which to connect'
+def _import_manager():
+    # vbox.manager pulls in subprocess and reports its progress through
+    # logging, so both are only loaded by the handlers that manage VMs. Once
+    # imported, the module is reachable as vbox.manager.
+    import logging
+    import vbox.manager
+
+    # Progress goes to stdout and errors to stderr
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.WARNING)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+        handlers=[stdout_handler, stderr_handler]
     )
-    parser.set_defaults(run=_start_and_connect)
 
 
 def _start_and_connect(args):
-    manager = vbox.manager.VMManager(name=args.name)
-    manager.start_and_connect(address=args.address, user=args.user)
-
+    _import_manager()
 
-def _add_start_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'start',
-        help='Brings up a VM'
-    )
-    parser.add_argument(
-        'name',
-        nargs='?',
-        help='name of VM'
-    )
-    parser.set_defaults(run=_start)
+    config = vbox.config.Config()
+    manager = vbox.manager.VMManager(name=args.name, config=config)
+    manager.start_and_connect(address=args.address, user=args.user)
 
 
 def _start(args):
-    manager = vbox.manager.VMManager(name=args.name)
-    manager.start()
+    _import_manager()
 
+    config = vbox.config.Config()
 
-def _add_stop_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'stop',
-        help='Shuts down a VM'
-    )
-    parser.add_argument(
-        'name',
-        nargs='?',
-        help='name of VM'
-    )
-    parser.set_defaults(run=_stop)
+    if len(args.names) > 1:
+        vbox.manager.VMManager.start_many(args.names, config=config)
+    else:
+        name = args.names[0] if args.names else None
+        manager = vbox.manager.VMManager(name=name, config=config)
+        manager.start()
 
 
 def _stop(args):
-    manager = vbox.manager.VMManager(name=args.name)
-    manager.stop()
+    _import_manager()
 
-
-def _add_reboot_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'reboot',
-        help='Reboots a VM'
-    )
-    parser.add_argument(
-        'name',
-        nargs='?',
-        help='name of VM'
-    )
-    parser.set_defaults(run=_reboot)
+    config = vbox.config.Config()
+    manager = vbox.manager.VMManager(name=args.name, config=config)
+    manager.stop()
 
 
 def _reboot(args):
-    manager = vbox.manager.VMManager(name=args.name)
-    manager.reboot()
+    _import_manager()
 
-
-def _add_add_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'add',
-        help='Adds a new VM definition to the config'
-    )
-    parser.add_argument(
-        'name',
-        help='name of VM'
-    )
-    parser.add_argument(
-        'address',
-        help='address of VM'
-    )
-    parser.set_defaults(run=_add)
+    config = vbox.config.Config()
+    manager = vbox.manager.VMManager(name=args.name, config=config)
+    manager.reboot()
 
 
 def _add(args):
@@ -155,92 +132,52 @@ def _add(args):
         config.create(args.name, args.address)
 
 
-def _add_remove_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'remove',
-        help='Removes a VM definition from the config'
-    )
-    parser.add_argument(
-        'name',
-        help='name of VM'
-    )
-    parser.set_defaults(run=_remove)
-
-
 def _remove(args):
     config = vbox.config.Config()
     config.remove_vm(args.name)
 
 
-def _add_select_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'select',
-        help='Sets the given VM as current in the config'
-    )
-    parser.add_argument(
-        'name',
-        help='name of VM'
-    )
-    parser.set_defaults(run=_select)
-
-
 def _select(args):
     config = vbox.config.Config()
     config.set_current_vm(args.name)
 
 
-def _add_list_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'list',
-        help='Lists all currently configured VMs'
-    )
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='displays VM details'
-    )
-    parser.set_defaults(run=_list)
-
-
 def _list(args):
     config = vbox.config.Config()
-    for vm_config in config.get_vms():
-        if args.verbose:
-            _print_vm_info(vm_config)
-        else:
-            print(vm_config['name'])
+    vm_configs = config.get_vms()
 
+    if args.verbose:
+        _print_vms_info(vm_configs, config)
+    else:
+        for vm_config in vm_configs:
+            print(vm_config['name'])
 
-def _print_vm_info(vm_config):
-    name = vm_config['name']
-    address = vm_config['address']
 
-    manager = vbox.manager.VMManager(name=name)
-    state = manager.get_state()
+def _print_vms_info(vm_configs, config):
+    _import_manager()
 
-    print(textwrap.dedent("""
-        {name}:
-            Address: {address}
-            State:   {state}
-    """).lstrip().format(
-        name=name,
-        address=address,
-        state=state)
+    states = vbox.manager.get_states(
+        [vm_config['name'] for vm_config in vm_configs],
+        config=config
     )
 
+    for vm_config, state in zip(vm_configs, states):
+        _print_vm_info(vm_config, state)
 
-def _add_current_subparser(subparsers):
-    parser = subparsers.add_parser(
-        'current',
-        help='Displays the current VM'
-    )
-    parser.add_argument(
-        'details',
-        nargs='?',
-        choices=['name', 'address', 'state', 'verbose'],
-        default='name'
+
+_VM_INFO_FORMAT = (
+    '{name}:\n'
+    '    Address: {address}\n'
+    '    State:   {state}\n'
+)
+
+
+def _print_vm_info(vm_config, state):
+    print(_VM_INFO_FORMAT.format(
+        name=vm_config['name'],
+        address=vm_config['address'],
+        state=state)
     )
-    parser.set_defaults(run=_display_current)
 
 
 def _display_current(args):
@@ -252,16 +189,111 @@ def _display_current(args):
     elif args.details == 'address':
         print(vm_config['address'])
     elif args.details == 'state':
-        manager = vbox.manager.VMManager(name=vm_config['name'])
+        _print_vm_state(vm_config, config)
+    else:
+        _print_vms_info([vm_config], config)
 
-        try:
-            state = manager.get_state()
-        except vbox.manager.Error:
-            state = 'unavailable'
 
-        print(state)
-    else:
-        _print_vm_info(vm_config)
+def _print_vm_state(vm_config, config):
+    _import_manager()
+
+    manager = vbox.manager.VMManager(name=vm_config['name'], config=config)
+
+    try:
+        state = manager.get_state()
+    except vbox.manager.Error:
+        state = 'unavailable'
+
+    print(state)
+
+
+_NAME_ARGUMENT = (('name',), {'help': 'name of VM'})
+_OPTIONAL_NAME_ARGUMENT = (('name',), {'nargs': '?', 'help': 'name of VM'})
+
+# Each subcommand is defined by its name, help text, (flags, options) pairs for
+# its arguments, and the function that runs it
+_SUBCOMMANDS = (
+    (
+        'connect',
+        'Connects to a VM via SSH (starts first if not running)',
+        (
+            _OPTIONAL_NAME_ARGUMENT,
+            (('-a', '--address'), {'help': 'address of VM'}),
+            (('-u', '--user'), {'help': 'user with which to connect'}),
+        ),
+        _start_and_connect
+    ),
+    (
+        'start',
+        'Brings up one or more VMs',
+        (
+            (
+                ('names',),
+                {'nargs': '*', 'metavar': 'name', 'help': 'names of VMs'}
+            ),
+        ),
+        _start
+    ),
+    (
+        'stop',
+        'Shuts down a VM',
+        (_OPTIONAL_NAME_ARGUMENT,),
+        _stop
+    ),
+    (
+        'reboot',
+        'Reboots a VM',
+        (_OPTIONAL_NAME_ARGUMENT,),
+        _reboot
+    ),
+    (
+        'add',
+        'Adds a new VM definition to the config',
+        (
+            _NAME_ARGUMENT,
+            (('address',), {'help': 'address of VM'}),
+        ),
+        _add
+    ),
+    (
+        'remove',
+        'Removes a VM definition from the config',
+        (_NAME_ARGUMENT,),
+        _remove
+    ),
+    (
+        'select',
+        'Sets the given VM as current in the config',
+        (_NAME_ARGUMENT,),
+        _select
+    ),
+    (
+        'list',
+        'Lists all currently configured VMs',
+        (
+            (
+                ('-v', '--verbose'),
+                {'action': 'store_true', 'help': 'displays VM details'}
+            ),
+        ),
+        _list
+    ),
+    (
+        'current',
+        'Displays the current VM',
+        (
+            (
+                ('details',),
+                {
+                    'nargs': '?',
+                    'choices': ['name', 'address', 'state', 'verbose'],
+                    'default': 'name'
+                }
+            ),
+        ),
+        _display_current
+    ),
+)
 
 
 if __name__ == '__main__':
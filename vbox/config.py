@@ -1,7 +1,5 @@
 """An interface to the configuration file"""
 
-from __future__ import print_function
-
 import os
 
 import vbox.json_file
@@ -13,19 +11,32 @@ class Error(vbox.error.Error):
     """Base class for errors in config module"""
 
 
-_HOME_DIR = os.path.expanduser('~')
-CONFIG_FILE_PATH = os.path.join(_HOME_DIR, '.vbox', 'config.json')
+def _default_config_path():
+    return os.path.join(os.path.expanduser('~'), '.vbox', 'config.json')
+
+
+def __getattr__(name):
+    # CONFIG_FILE_PATH is resolved on first access so that importing this module doesn't look up
+    # the home directory
+    if name == 'CONFIG_FILE_PATH':
+        return _default_config_path()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 class Config(object):
 
     """Gets and sets configuration data"""
 
-    def __init__(self, path=CONFIG_FILE_PATH):
+    def __init__(self, path=None):
         """
         *path* is an optional path to the config file (defaults to CONFIG_FILE_PATH)
         """
-        self.json_file = vbox.json_file.JsonFile(path, validate=_validate, indent=2)
+        self._vms_by_name = (None, {})
+        self.json_file = vbox.json_file.JsonFile(
+            path if path is not None else _default_config_path(),
+            validate=self._validate,
+            indent=2
+        )
 
     def create(self, name, address):
         """
@@ -52,7 +63,7 @@ class Config(object):
         """
         with self.json_file.modify() as config:
             try:
-                vm_config = _find_vm_config(config, name)
+                vm_config = self._lookup_vm(config, name)
             except VMNotFoundError:
                 vm_config = {
                     'name': name
@@ -83,7 +94,7 @@ class Config(object):
         Raises json_file.JsonFileNotFoundError, json_file.InvalidDataError, and VMNotFoundError
         """
         config = self.json_file.read()
-        return _find_vm_config(config, name)
+        return self._lookup_vm(config, name)
 
     def get_vms(self):
         """
@@ -112,32 +123,44 @@ class Config(object):
         """
         config = self.json_file.read()
         current_vm_name = config['current']
-        return _find_vm_config(config, current_vm_name)
-
-
-def _validate(config):
-    if 'vms' not in config:
-        raise vbox.json_file.InvalidDataError('Missing list of VMs')
-
-    try:
-        current_vm_name = config['current']
-    except KeyError:
-        raise vbox.json_file.InvalidDataError('Missing current VM')
-
-    try:
-        _find_vm_config(config, current_vm_name)
-    except VMNotFoundError:
-        raise vbox.json_file.InvalidDataError(
-            'Current VM {} does not exist in config'.format(current_vm_name)
-        )
-
-
-def _find_vm_config(config, name):
-    for vm_config in config['vms']:
-        if vm_config['name'] == name:
-            return vm_config
-
-    raise VMNotFoundError(name)
+        return self._lookup_vm(config, current_vm_name)
+
+    def _lookup_vm(self, config, name):
+        # json_file returns the same cached object until the file changes, so the index only needs
+        # to be rebuilt when a different object comes back
+        indexed_config, vms_by_name = self._vms_by_name
+        if indexed_config is not config:
+            vms_by_name = self._index_vms(config)
+
+        try:
+            return vms_by_name[name]
+        except KeyError:
+            raise VMNotFoundError(name)
+
+    def _index_vms(self, config):
+        vms_by_name = {}
+        for vm_config in config['vms']:
+            vms_by_name.setdefault(vm_config['name'], vm_config)
+
+        self._vms_by_name = (config, vms_by_name)
+        return vms_by_name
+
+    def _validate(self, config):
+        if 'vms' not in config:
+            raise vbox.json_file.InvalidDataError('Missing list of VMs')
+
+        try:
+            current_vm_name = config['current']
+        except KeyError:
+            raise vbox.json_file.InvalidDataError('Missing current VM')
+
+        # The index is always rebuilt here, since the data being validated may be a modified copy.
+        # Looking up a VM in data that has just been read, or that modify() has just yielded, then
+        # reuses it.
+        if current_vm_name not in self._index_vms(config):
+            raise vbox.json_file.InvalidDataError(
+                'Current VM {} does not exist in config'.format(current_vm_name)
+            )
 
 
 class VMNotFoundError(Error):
@@ -145,4 +168,4 @@ class VMNotFoundError(Error):
     """VM does not exist in config"""
 
     def __init__(self, name):
-        super(VMNotFoundError, self).__init__('VM {} does not exist in config'.format(name))
+        super().__init__('VM {} does not exist in config'.format(name))
@@ -1,9 +1,9 @@
 """An interface for reading, writing, and modifying a JSON file"""
 
 import contextlib
-import errno
 import json
 import os
+import stat
 
 import vbox.error
 
@@ -30,28 +30,46 @@ class JsonFile(object):
         self.path = path
         self._validate = validate
         self._indent = indent
+        self._cache = None
+        self._cache_validated = False
 
     def read(self, validate=True):
         """
         Reads the JSON data from the file
 
-        Returns a dictionary
+        Returns a dictionary. The data is cached until the file changes, so the returned dictionary
+        must not be modified; use modify() instead.
 
         Raises JsonFileNotFoundError if the data file doesn't exist
 
         If *validate* is True, raises InvalidDataError if the data is invalid
         """
+        try:
+            file_stat = os.stat(self.path)
+        except OSError:
+            raise JsonFileNotFoundError(self.path)
+
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._cache is not None and self._cache[0] == cache_key:
+            data = self._cache[1]
+        else:
+            data = self._load()
+            self._cache = (cache_key, data)
+            self._cache_validated = False
+
+        if validate and not self._cache_validated:
+            self._validate(data)
+            self._cache_validated = True
+        return data
+
+    def _load(self):
         try:
             with self._open_file() as data_file:
-                data = json.load(data_file)
+                return json.load(data_file)
         except IOError:
             raise JsonFileNotFoundError(self.path)
         except ValueError as err:
             raise InvalidDataError(str(err))
-        else:
-            if validate:
-                self._validate(data)
-            return data
 
     @contextlib.contextmanager
     def _open_file(self, *args, **kwargs):
@@ -64,17 +82,43 @@ class JsonFile(object):
 
         If *validate* is True, raises InvalidDataError if the data is invalid
         """
+        # tempfile takes a few milliseconds to import, which commands that only read don't need
+        import tempfile
+
         if validate:
             self._validate(data)
 
+        self._cache = None
         self._ensure_directory_exists()
 
-        with self._open_file(mode='w') as data_file:
-            json.dump(data, data_file, indent=self._indent)
+        # Write the whole file to a uniquely named temporary file, sync it to disk, and move it
+        # into place, so that the data file is never left partially written, even if the machine
+        # loses power, and concurrent writers can't clobber each other's temporary files
+        serialized_data = json.dumps(data, indent=self._indent)
+
+        # Replace the file a symlink points to rather than the symlink itself
+        real_path = os.path.realpath(self.path)
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(real_path),
+            prefix=os.path.basename(real_path) + '.',
+            suffix='.tmp'
+        )
+        try:
+            with os.fdopen(temp_fd, mode='w') as temp_file:
+                temp_file.write(serialized_data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            _copy_mode(real_path, temp_path)
+            os.replace(temp_path, real_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
 
     def _ensure_directory_exists(self):
         directory = os.path.dirname(self.path)
-        _mkdirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
     @contextlib.contextmanager
     def modify(self, validate=True):
@@ -86,7 +130,10 @@ class JsonFile(object):
 
         If *validate* is True, raises InvalidDataError if the data is invalid
         """
-        data = self.read(validate=validate)
+        # Load a private copy rather than the cached data so that it can be modified freely
+        data = self._load()
+        if validate:
+            self._validate(data)
         yield data
         self.write(data, validate=validate)
 
@@ -96,7 +143,7 @@ class JsonFileNotFoundError(Error):
     """Data file does not exist"""
 
     def __init__(self, path):
-        super(JsonFileNotFoundError, self).__init__('File {} does not exist'.format(path))
+        super().__init__('File {} does not exist'.format(path))
 
 
 class InvalidDataError(Error):
@@ -104,13 +151,14 @@ class InvalidDataError(Error):
     """Data format is invalid"""
 
     def __init__(self, reason):
-        super(InvalidDataError, self).__init__('Data is invalid: {}'.format(reason))
+        super().__init__('Data is invalid: {}'.format(reason))
 
 
-def _mkdirs(newdir, *args, **kwargs):
+def _copy_mode(path, temp_path):
+    # mkstemp creates files that only their owner can read, so give the temporary file the
+    # permissions of the file it replaces
     try:
-        os.makedirs(newdir, *args, **kwargs)
-    except OSError as err:
-        # Reraise the error unless it's about an already existing directory
-        if err.errno != errno.EEXIST or not os.path.isdir(newdir):
-            raise
+        mode = os.stat(path).st_mode
+    except OSError:
+        return
+    os.chmod(temp_path, stat.S_IMODE(mode))
@@ -1,33 +1,88 @@
 """An interface for managing the state of, and connecting to, VMs"""
 
-from __future__ import print_function
-
-import re
+import logging
+import os
+import shutil
+import socket
 import subprocess
+import threading
 import time
 
 import vbox.config
 import vbox.error
 
+# asyncio and concurrent.futures take longer to import than the rest of the
+# module put together, and only connecting and managing several VMs at once
+# need them, so they are imported by the functions that use them
+
+LOG = logging.getLogger(__name__)
+
 
 class Error(vbox.error.Error):
 
     """Base class for errors in manager module"""
 
 
+_SSH_PORT = 22
+
+# SSH sessions to a VM share one master connection, so attaching again skips
+# the TCP handshake, key exchange and authentication. ssh expands the ~ in
+# ControlPath itself.
+_SSH_CONTROL_DIR = '~/.vbox'
+_SSH_OPTIONS = (
+    '-o', 'ControlMaster=auto',
+    '-o', 'ControlPath={}/ssh-%C'.format(_SSH_CONTROL_DIR),
+    '-o', 'ControlPersist=60s',
+    '-o', 'ConnectTimeout=5',
+)
+
+# Number of seconds for which a queried VM state is reused
+_STATE_CACHE_TTL = 1
+
+# Names VBoxManage uses for the machine states reported by the VirtualBox API
+_API_STATE_NAMES = {
+    'PoweredOff': 'poweroff',
+    'Saved': 'saved',
+    'Aborted': 'aborted',
+    'Running': 'running',
+    'Paused': 'paused',
+    'Stuck': 'gurumeditation',
+    'Starting': 'starting',
+    'Stopping': 'stopping',
+    'Saving': 'saving',
+    'Restoring': 'restoring',
+}
+
+# Lazily created (VirtualBoxManager, IVirtualBox) for talking to VBoxSVC
+# in-process from the main thread, or False if the API isn't available
+_vbox_api = None  # type: tuple | bool | None
+
+# Lazily resolved location of the VBoxManage executable
+_vboxmanage_path = None  # type: str | None
+
+# The (host, port) to which ssh connects for each address, as resolved from
+# the SSH config
+_ssh_endpoints = {}  # type: dict
+
+
 class VMManager(object):
 
     """Starts, stops, and connects to a VM"""
 
-    def __init__(self, name=None):
+    def __init__(self, name=None, config=None):
         """
         *name* is the name of the VM to manage. If omitted, the current VM set
         in the config will be used.
+
+        *config* is an optional config.Config instance to use for looking up
+        VM definitions. If omitted, a new one will be created.
         """
-        self._config = vbox.config.Config()
+        self._config = config if config is not None else vbox.config.Config()
         self.name = (
             name if name is not None else self._config.get_current_vm()['name']
         )
+        self._state_cache = None
+        self._default_address = None
 
     def start_and_connect(
             self,
@@ -48,10 +103,15 @@ class VMManager(object):
         *tries* is the number of times to try connecting to the VM before
         timing out (default: 10)
 
-        *retry_interval* is the number of seconds to wait before each retry
-        (default: 5)
+        *retry_interval* is the maximum number of seconds to wait before each
+        retry. The first wait is half a second and each one after that is
+        twice as long as the last. (default: 5)
         """
-        self.start()
+        # A VM that already accepts SSH connections must be running, so its
+        # state doesn't need checking
+        if not self._is_ssh_reachable(address=address, user=user):
+            self.start()
+
         self.connect(
             address=address,
             user=user,
@@ -59,20 +119,94 @@ class VMManager(object):
             retry_interval=retry_interval
         )
 
+    def _is_ssh_reachable(self, address=None, user=None, timeout=0.2):
+        endpoint = _get_ssh_endpoint(self._get_ssh_address(address, user))
+        if endpoint is None:
+            # ssh connects through a proxy, so there's no way to tell
+            return False
+
+        try:
+            return _is_port_open(*endpoint, timeout=timeout)
+        except socket.gaierror:
+            return False
+
+    @classmethod
+    def start_many(cls, names, config=None, max_workers=8):
+        """
+        Powers on each of the VMs with the given *names* that is not already
+        running
+
+        The VMs are started concurrently using up to *max_workers* threads,
+        since each start is spent waiting on a VBoxManage process.
+
+        *config* is an optional config.Config instance to share between the VM
+        managers
+        """
+        import concurrent.futures
+
+        def start(name):
+            cls(name=name, config=config).start()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(start, names))
+
+    @classmethod
+    def start_and_connect_many(
+            cls,
+            names,
+            address=None,
+            user=None,
+            tries=10,
+            retry_interval=5,
+            config=None):
+        """
+        Powers on each of the VMs with the given *names* that is not already
+        running and then connects to the first one via SSH
+
+        The other arguments are as for start_many and start_and_connect.
+        """
+        cls.start_many(names, config=config)
+
+        manager = cls(name=names[0], config=config)
+        manager.connect(
+            address=address,
+            user=user,
+            tries=tries,
+            retry_interval=retry_interval
+        )
+
     def start(self):
         """Powers on the VM if it is not already running"""
-        if self.is_running():
-            print('VM "{}" is already running'.format(self.name))
-        else:
-            subprocess.check_call(
-                ['VBoxManage', 'startvm', self.name, '--type', 'headless']
+        # Rather than checking the state first, just try starting the VM and
+        # recognise the error VBoxManage gives if it's already running
+        try:
+            output = subprocess.check_output(
+                _vboxmanage_command(
+                    'startvm', self.name, '--type', 'headless'
+                ),
+                stderr=subprocess.STDOUT,
+                close_fds=False
             )
+        except subprocess.CalledProcessError as err:
+            if not _is_already_running_error(err.output):
+                LOG.error('%s', err.output.decode().rstrip())
+                raise
+
+            LOG.info('VM "%s" is already running', self.name)
+        else:
+            LOG.info('%s', output.decode().rstrip())
+
+        self._cache_state('running')
 
     def is_running(self):
         """Returns True if the VM is currently running"""
+        cached_state = self._get_cached_state()
+        if cached_state is not None:
+            return cached_state == 'running'
+
         try:
-            return self.get_state() == 'running'
-        except (StateUnavailableError, VBoxManageOutputParseError):
+            return self.name in _list_running_vms()
+        except subprocess.CalledProcessError:
             return False
 
     def get_state(self):
@@ -81,25 +215,160 @@ class VMManager(object):
 
         Raises StateUnavailableError and VBoxManageOutputParseError
         """
+        state = self._get_cached_state()
+        if state is None:
+            state = self._query_state()
+            self._cache_state(state)
+
+        return state
+
+    def _get_cached_state(self):
+        if self._state_cache is None:
+            return None
+
+        cached_at, state = self._state_cache
+        if time.monotonic() - cached_at >= _STATE_CACHE_TTL:
+            return None
+
+        return state
+
+    def _cache_state(self, state):
+        self._state_cache = (time.monotonic(), state)
+
+    def _query_state(self):
+        state = self._query_state_from_api()
+        if state is not None:
+            return state
+
         try:
-            vm_info = subprocess.check_output(
-                ['VBoxManage', 'showvminfo', '--machinereadable', self.name]
-            )
+            vm_info = self._query_vm_info('VMState')
         except subprocess.CalledProcessError:
             raise StateUnavailableError(self.name)
 
-        vm_state_match = re.search(
-            r'^VMState="(.*)"$',
-            vm_info,
-            flags=re.MULTILINE
-        )
-
-        if vm_state_match is None:
+        try:
+            return vm_info['VMState']
+        except KeyError:
             raise VBoxManageOutputParseError(
-                'Could not state of VM {}'.format(self.name)
+                'Could not parse state of VM {}'.format(self.name)
+            )
+
+    def _query_state_from_api(self):
+        # Returns None if the state can't be read through the VirtualBox API,
+        # leaving VBoxManage to report the state or the error
+        api = _get_vbox_api()
+        if api is None:
+            return None
+
+        vbox_manager, virtualbox = api
+        try:
+            machine = virtualbox.findMachine(self.name)
+            return _get_api_state_name(vbox_manager, machine.state)
+        except Exception:  # The API raises backend-specific COM errors
+            return None
+
+    def _try_waiting_through_api(self, waiting_states, deadline):
+        """
+        Waits until *deadline*, a time.monotonic() value, for the VM to leave
+        *waiting_states*. The VirtualBox API reports each state change as soon
+        as it happens rather than on the next poll.
+
+        Returns True if the API handled the wait, whether the VM left
+        *waiting_states* or the deadline passed; the caller has to check the
+        resulting state. Returns False if the API isn't available or fails, in
+        which case the caller has to poll until *deadline* instead.
+        """
+        api = _get_vbox_api()
+        if api is None:
+            return False
+
+        vbox_manager, virtualbox = api
+        try:
+            machine_id = virtualbox.findMachine(self.name).id
+            event_source = virtualbox.eventSource
+            listener = event_source.createListener()
+            event_source.registerListener(
+                listener,
+                [vbox_manager.constants.VBoxEventType_OnMachineStateChanged],
+                False
             )
+        except Exception:  # The API raises backend-specific COM errors
+            return False
 
-        return vm_state_match.group(1)
+        try:
+            # Check only after registering so that no transition is missed
+            state = self._query_state_from_api()
+            if state is None:
+                return False
+            if state not in waiting_states:
+                return True
+
+            while time.monotonic() < deadline:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                event = event_source.getEvent(listener, max(remaining_ms, 0))
+                if event is None:
+                    continue
+
+                event_source.eventProcessed(listener, event)
+                state_event = vbox_manager.queryInterface(
+                    event, 'IMachineStateChangedEvent'
+                )
+                if state_event.machineId == machine_id:
+                    state = _get_api_state_name(
+                        vbox_manager, state_event.state
+                    )
+                    # States without a VBoxManage name are taken as ones
+                    # the VM is still passing through
+                    if state is not None and state not in waiting_states:
+                        return True
+        except Exception:  # The API raises backend-specific COM errors
+            return False
+        finally:
+            try:
+                event_source.unregisterListener(listener)
+            except Exception:  # The API raises backend-specific COM errors
+                pass
+
+        return True
+
+    def _query_vm_info(self, *keys):
+        """
+        Returns a dictionary of the values of the given *keys* in the output
+        of "VBoxManage showvminfo --machinereadable", omitting any that are
+        missing. Since the output is read as it is produced, VBoxManage is
+        stopped as soon as all of the keys have been found.
+
+        Raises subprocess.CalledProcessError if VBoxManage fails before all of
+        the keys have been found
+        """
+        wanted_keys = {key.encode() for key in keys}
+        vm_info = {}
+
+        command = _vboxmanage_command(
+            'showvminfo', '--machinereadable', self.name
+        )
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            close_fds=False
+        )
+
+        try:
+            for line in process.stdout:
+                key, found, value = line.rstrip(b'\r\n').partition(b'=')
+                if found and key in wanted_keys:
+                    vm_info[key.decode()] = _unquote(value).decode()
+
+                    if len(vm_info) == len(wanted_keys):
+                        process.terminate()
+                        break
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+
+        if len(vm_info) < len(wanted_keys) and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
+
+        return vm_info
 
     def connect(self, address=None, user=None, tries=10, retry_interval=5):
         """
@@ -115,68 +384,149 @@ class VMManager(object):
         *tries* is the number of times to try connecting to the VM before
         timing out (default: 10)
 
-        *retry_interval* is the number of seconds to wait before each retry
-        (default: 5)
+        *retry_interval* is the maximum number of seconds to wait before each
+        retry. The first wait is half a second and each one after that is
+        twice as long as the last. (default: 5)
         """
-        address = (
-            address if address is not None else
-            self._config.get_vm(self.name)['address']
-        )
+        import asyncio
 
-        if user is not None:
-            address = '{}@{}'.format(user, address)
+        asyncio.run(self.connect_async(
+            address=address,
+            user=user,
+            tries=tries,
+            retry_interval=retry_interval
+        ))
 
-        print('Connecting to {}'.format(address))
+    async def connect_async(
+            self,
+            address=None,
+            user=None,
+            tries=10,
+            retry_interval=5):
+        """
+        Coroutine version of connect, so that a single event loop can wait on
+        several VMs at once
+
+        The arguments are as for connect.
+        """
+        import asyncio
+
+        address = self._get_ssh_address(address, user)
+
+        LOG.info('Connecting to %s', address)
+
+        endpoint = await _get_ssh_endpoint_async(address)
+        ssh_command = ['ssh', *_SSH_OPTIONS, address]
+
+        # ssh fails outright if the directory for the control socket is missing
+        os.makedirs(os.path.expanduser(_SSH_CONTROL_DIR), exist_ok=True)
 
         success = False
         remaining_tries = tries
+        retry_delay = 0.5
         while (not success) and (remaining_tries > 0):
-            try:
-                subprocess.check_call(['ssh', address])
-            except subprocess.CalledProcessError:
-                print('Failed to connect to {}; waiting...'.format(address))
-                remaining_tries -= 1
-                time.sleep(retry_interval)
-                print('Retrying...')
+            attempt_started = time.monotonic()
+            attempt_delay = min(retry_delay, retry_interval)
+
+            # Only spawn ssh once the port accepts connections, since a failed
+            # probe is far quicker than a failed ssh attempt. The probe waits
+            # for the VM to answer for the whole delay rather than sleeping
+            # through it, so it succeeds as soon as sshd starts listening.
+            # There is nothing to probe if ssh goes through a proxy, and the
+            # last attempt is always left to ssh in case the probe is wrong.
+            if endpoint is None or remaining_tries == 1:
+                port_open = True
             else:
-                success = True
+                try:
+                    port_open = await _is_port_open_async(
+                        *endpoint,
+                        timeout=max(attempt_delay, 1)
+                    )
+                except socket.gaierror:
+                    # Leave it to ssh to report that the host doesn't exist
+                    port_open = True
+
+            if port_open:
+                process = await asyncio.create_subprocess_exec(*ssh_command)
+                success = await process.wait() == 0
+
+            if not success:
+                LOG.debug('Failed to connect to %s', address)
+                remaining_tries -= 1
+
+            if (not success) and (remaining_tries > 0):
+                elapsed = time.monotonic() - attempt_started
+                await asyncio.sleep(max(0, attempt_delay - elapsed))
+                retry_delay *= 2
+                LOG.info(
+                    'Retrying connection to %s (attempt %d of %d)...',
+                    address,
+                    tries - remaining_tries + 1,
+                    tries
+                )
 
         if not success:
             raise ConnectionFailure(address, tries)
 
+    def _get_ssh_address(self, address, user):
+        # Returns the address as given to ssh, i.e. user@host if there's a user
+        address = (
+            address if address is not None else self._get_default_address()
+        )
+
+        if user is not None:
+            address = '{}@{}'.format(user, address)
+
+        return address
+
+    def _get_default_address(self):
+        # Looked up on first use rather than in __init__, since VMs that
+        # aren't in the config can still be managed by name
+        if self._default_address is None:
+            self._default_address = self._config.get_vm(self.name)['address']
+
+        return self._default_address
+
     def stop(self):
         """Shuts down the VM if it is currently running"""
         if self.is_running():
-            print('Shutting down VM "{}"...'.format(self.name))
+            LOG.info('Shutting down VM "%s"...', self.name)
             subprocess.check_call(
-                ['VBoxManage', 'controlvm', self.name, 'acpipowerbutton']
+                _vboxmanage_command('controlvm', self.name, 'acpipowerbutton'),
+                close_fds=False
             )
+            self._state_cache = None
         else:
-            print('VM "{}" is not running'.format(self.name))
+            LOG.info('VM "%s" is not running', self.name)
 
         self._wait_for_shutdown()
 
-    def _wait_for_shutdown(self, tries=20, retry_interval=0.5):
+    def _wait_for_shutdown(
+            self,
+            timeout=10,
+            initial_interval=0.1,
+            max_interval=1):
+        deadline = time.monotonic() + timeout
+
+        # A VM that is in any other state (e.g. saved or aborted) won't power
+        # off by itself, so there's no point in waiting for it
+        waiting_states = ('running', 'stopping')
+        if not self._try_waiting_through_api(waiting_states, deadline):
+            # Poll often at first to notice a quick shutdown, then back off
+            interval = initial_interval
+            while self.is_running() and (time.monotonic() < deadline):
+                time.sleep(min(interval, max(0, deadline - time.monotonic())))
+                interval = min(interval * 2, max_interval)
+
         try:
             state = self.get_state()
         except (StateUnavailableError, VBoxManageOutputParseError):
             state = None
 
-        remaining_tries = tries
-        while (state != 'poweroff') and (remaining_tries > 0):
-            time.sleep(retry_interval)
-
-            try:
-                state = self.get_state()
-            except (StateUnavailableError, VBoxManageOutputParseError):
-                state = None
-
-            remaining_tries -= 1
-
         if state != 'poweroff':
             raise ShutdownFailure(self.name)
 
-        print('VM "{}" has been successfully shut down'.format(self.name))
+        LOG.info('VM "%s" has been successfully shut down', self.name)
 
     def reboot(self):
         """Reboots the VM if it is currently running"""
@@ -184,12 +534,247 @@ class VMManager(object):
         self.start()
 
 
+def get_states(names, config=None, max_workers=8):
+    """
+    Returns a list of the states of the VMs with the given *names*, in the
+    same order
+
+    The VMs are queried concurrently using up to *max_workers* threads, since
+    each query is spent waiting on a VBoxManage process. A single VM, or any
+    number of them when the VirtualBox API is available, is queried directly
+    on the calling thread instead.
+
+    *config* is an optional config.Config instance to share between the VM
+    managers
+
+    Raises StateUnavailableError and VBoxManageOutputParseError
+    """
+    def get_state(name):
+        return VMManager(name=name, config=config).get_state()
+
+    # There's nothing to gain from threads for a single VM. Nor is there when
+    # the VirtualBox API is available, since it can only be used from the main
+    # thread and querying it in-process is quick.
+    if len(names) <= 1 or _get_vbox_api() is not None:
+        return [get_state(name) for name in names]
+
+    import concurrent.futures
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    with executor:
+        return list(executor.map(get_state, names))
+
+
+def _get_vbox_api():
+    """
+    Returns a (VirtualBoxManager, IVirtualBox) tuple for querying VBoxSVC
+    directly instead of spawning VBoxManage, or None if the vboxapi package
+    isn't installed, VBoxSVC can't be reached, or the caller isn't on the main
+    thread
+
+    The connection is only ever set up and used on the main thread, since
+    XPCOM/COM objects are bound to the thread that creates them and setting
+    them up from several threads at once isn't safe.
+    """
+    global _vbox_api
+
+    if threading.current_thread() is not threading.main_thread():
+        return None
+
+    if _vbox_api is None:
+        try:
+            import vboxapi  # type: ignore[import-not-found]
+
+            vbox_manager = vboxapi.VirtualBoxManager(None, None)
+            virtualbox = vbox_manager.getVirtualBox()
+        except Exception:  # Also covers backend-specific COM errors
+            _vbox_api = False
+        else:
+            _vbox_api = (vbox_manager, virtualbox)
+
+    if not _vbox_api:
+        return None
+
+    return _vbox_api
+
+
+def _get_api_state_name(vbox_manager, value):
+    # Returns the VBoxManage name of the given MachineState value, or None if
+    # it has none
+    states = vbox_manager.constants.all_values('MachineState')
+    for api_name, state_value in states.items():
+        if state_value == value:
+            return _API_STATE_NAMES.get(api_name)
+
+    return None
+
+
+def _vboxmanage_command(*args):
+    """
+    Returns the command line for running VBoxManage with the given *args*
+
+    VBoxManage is given by its full path, which is one of the conditions for
+    subprocess to launch it with os.posix_spawn rather than fork and exec.
+    Callers should also pass close_fds=False, which is the other; it's safe
+    because Python creates file descriptors as non-inheritable.
+    """
+    global _vboxmanage_path
+
+    if _vboxmanage_path is None:
+        _vboxmanage_path = shutil.which('VBoxManage') or 'VBoxManage'
+
+    # --nologo keeps the version banner out of the output
+    return [_vboxmanage_path, '--nologo', *args]
+
+
+def _is_already_running_error(output):
+    return (
+        b'is already locked by a session' in output or
+        b'VBOX_E_INVALID_OBJECT_STATE' in output
+    )
+
+
+def _get_ssh_endpoint(address):
+    """
+    Returns the (host, port) to which ssh connects for *address*, taking the
+    SSH config into account (e.g. a Host entry for a VM whose SSH port is
+    forwarded to localhost), or None if ssh connects through a proxy
+
+    Falls back to the host in *address* and the standard SSH port if ssh
+    can't resolve the config.
+    """
+    if address not in _ssh_endpoints:
+        try:
+            output = subprocess.check_output(
+                ['ssh', '-G', address],
+                stderr=subprocess.DEVNULL
+            )
+        except (OSError, subprocess.CalledProcessError):
+            output = None
+
+        _ssh_endpoints[address] = _parse_ssh_endpoint(address, output)
+
+    return _ssh_endpoints[address]
+
+
+async def _get_ssh_endpoint_async(address):
+    """Coroutine version of _get_ssh_endpoint"""
+    import asyncio
+
+    if address not in _ssh_endpoints:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'ssh', '-G', address,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            output = None
+        else:
+            output, _ = await process.communicate()
+            if process.returncode != 0:
+                output = None
+
+        _ssh_endpoints[address] = _parse_ssh_endpoint(address, output)
+
+    return _ssh_endpoints[address]
+
+
+def _parse_ssh_endpoint(address, output):
+    # Returns the endpoint for *address* given the output of "ssh -G", or
+    # None if ssh couldn't resolve the config
+    if output is None:
+        return (_get_host(address), _SSH_PORT)
+
+    options = {}
+    for line in output.decode().splitlines():
+        key, _, value = line.partition(' ')
+        options[key] = value
+
+    if (options.get('proxycommand', 'none') != 'none' or
+            options.get('proxyjump', 'none') != 'none'):
+        return None
+
+    return (
+        options.get('hostname', _get_host(address)),
+        int(options.get('port', _SSH_PORT))
+    )
+
+
+def _is_port_open(host, port, timeout):
+    """
+    Returns True if a TCP connection can be made to *port* on *host* within
+    *timeout* seconds
+
+    Raises socket.gaierror if *host* can't be resolved
+    """
+    try:
+        connection = socket.create_connection((host, port), timeout)
+    except socket.gaierror:
+        raise
+    except OSError:
+        return False
+
+    connection.close()
+    return True
+
+
+async def _is_port_open_async(host, port, timeout):
+    """Coroutine version of _is_port_open"""
+    import asyncio
+
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port),
+            timeout
+        )
+    except socket.gaierror:
+        raise
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    await writer.wait_closed()
+    return True
+
+
+def _get_host(address):
+    # Strips the user from a user@host address
+    return address.rpartition('@')[2]
+
+
+def _unquote(value):
+    if len(value) >= 2 and value.startswith(b'"') and value.endswith(b'"'):
+        return value[1:-1]
+    return value
+
+
+def _list_running_vms():
+    """
+    Returns a set of the names of all running VMs
+
+    Raises subprocess.CalledProcessError
+    """
+    output = subprocess.check_output(
+        _vboxmanage_command('list', 'runningvms'),
+        close_fds=False
+    )
+
+    # Each line has the form: "<name>" {<uuid>}
+    names = set()
+    for line in output.splitlines():
+        quoted_name, _, _ = line.rpartition(b' {')
+        names.add(quoted_name[1:-1].decode())
+
+    return names
+
+
 class StateUnavailableError(Error):
 
     """Error getting the state of a VM"""
 
     def __init__(self, name):
-        super(StateUnavailableError, self).__init__(
+        super().__init__(
             'Failed to get state for VM {}'.format(name)
         )
 
@@ -204,7 +789,7 @@ class ConnectionFailure(Error):
     """Failed to connect to VM"""
 
     def __init__(self, address, tries):
-        super(ConnectionFailure, self).__init__(
+        super().__init__(
             'Failed to connect to {} after {} tries'.format(address, tries)
         )
 
@@ -214,6 +799,6 @@ class ShutdownFailure(Error):
     """Failed to shut down the VM"""
 
     def __init__(self, name):
-        super(ShutdownFailure, self).__init__(
+        super().__init__(
             'Failed to shut down VM {}'.format(name)
         )